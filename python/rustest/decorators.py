@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from collections.abc import Callable, Mapping, Sequence
 import inspect
+import itertools
 import sys
 from typing import Any, ParamSpec, TypeVar, overload, cast
 
@@ -289,21 +290,15 @@ def _cross_product_cases(
             {"id": "a2-b2", "values": {"a": 2, "b": 20}},
         ]
     """
-    combined: list[dict[str, object]] = []
-
-    for existing_case in existing:
-        for new_case in new:
-            # Merge the parameter values from both cases
-            combined_values = {}
-            combined_values.update(existing_case["values"])  # type: ignore[arg-type]
-            combined_values.update(new_case["values"])  # type: ignore[arg-type]
-
+    return tuple(
+        {
             # Combine the IDs with a hyphen separator
-            combined_id = f"{existing_case['id']}-{new_case['id']}"
-
-            combined.append({"id": combined_id, "values": combined_values})
-
-    return tuple(combined)
+            "id": f"{existing_case['id']}-{new_case['id']}",
+            # Merge the parameter values from both cases
+            "values": {**existing_case["values"], **new_case["values"]},  # type: ignore[dict-item]
+        }
+        for existing_case, new_case in itertools.product(existing, new)
+    )
 
 
 def parametrize(
@@ -101,13 +101,9 @@ def resolve_fixture(
             + f"      assert {name} is not None\n"
         )
 
-    # Get fixture parameters
-    sig = inspect.signature(fixture_func)
-    params = sig.parameters
-
     # Resolve dependencies recursively
     resolved_args = {}
-    for param_name in params:
+    for param_name in _fixture_argnames(fixture_func):
         # Use get_fixture() which has lock protection, instead of checking registry directly
         try:
             # Try to get the fixture (thread-safe with lock)
@@ -136,6 +132,24 @@ def resolve_fixture(
     return result
 
 
+def _fixture_argnames(fixture_func: Any) -> tuple[str, ...]:
+    """Return the parameter names of a fixture callable.
+
+    Plain functions are read straight from their code object. Bound methods,
+    wrapped callables, ``__signature__`` overrides and ``*args``/``**kwargs``
+    signatures fall back to :func:`inspect.signature`.
+    """
+    if (
+        inspect.isfunction(fixture_func)
+        and not hasattr(fixture_func, "__wrapped__")
+        and not hasattr(fixture_func, "__signature__")
+        and not fixture_func.__code__.co_flags & (inspect.CO_VARARGS | inspect.CO_VARKEYWORDS)
+    ):
+        code = fixture_func.__code__
+        return code.co_varnames[: code.co_argcount + code.co_kwonlyargcount]
+    return tuple(inspect.signature(fixture_func).parameters)
+
+
 def _resolve_request_argument(request_obj: Any | None) -> Any:
     if request_obj is not None:
         return request_obj
@@ -11,6 +11,8 @@ This module tests the pytest compatibility features including:
 
 from __future__ import annotations
 
+import functools
+import inspect
 import warnings
 
 import pytest
@@ -24,7 +26,7 @@ from rustest.compat.pytest import (
 )
 from rustest.decorators import parametrize, ParameterSet, _build_cases
 from rustest.builtin_fixtures import CaptureFixture
-from rustest.fixture_registry import register_fixtures, clear_registry
+from rustest.fixture_registry import _fixture_argnames, register_fixtures, clear_registry
 
 
 # =============================================================================
@@ -779,3 +781,53 @@ class TestFixtureRequestFallback:
             assert result is request
         finally:
             clear_registry()
+
+
+def _plain(a, b=1):
+    return a
+
+
+def _keyword_only(a, *, b, c=2):
+    return a
+
+
+def _var_args(a, *args, b, **kwargs):
+    return a
+
+
+def _overridden(a, b):
+    return a
+
+
+_overridden.__signature__ = inspect.signature(lambda x: x)
+
+
+@functools.wraps(_plain)
+def _wrapper(*args, **kwargs):
+    return _plain(*args, **kwargs)
+
+
+class _FixtureHolder:
+    def method(self, a, b):
+        return a
+
+
+class TestFixtureArgnames:
+    """Tests that _fixture_argnames agrees with inspect.signature."""
+
+    @pytest.mark.parametrize(
+        ("func", "expected"),
+        [
+            (_plain, ("a", "b")),
+            (_keyword_only, ("a", "b", "c")),
+            (_FixtureHolder().method, ("a", "b")),
+            (_var_args, ("a", "args", "b", "kwargs")),
+            (_overridden, ("x",)),
+            (_wrapper, ("a", "b")),
+        ],
+        ids=["plain", "keyword_only", "bound_method", "var_args", "signature", "wraps"],
+    )
+    def test_matches_inspect_signature(self, func, expected):
+        """The code-object fast path and the fallback give the same names."""
+        assert _fixture_argnames(func) == expected
+        assert _fixture_argnames(func) == tuple(inspect.signature(func).parameters)
@@ -371,6 +371,8 @@ pub fn discover_tests(
     // Load conftest fixtures (must be sequential due to Python GIL)
     let mut conftest_fixtures: HashMap<PathBuf, IndexMap<String, Fixture>> = HashMap::new();
     let mut detected_pytest_fixtures: Vec<(PathBuf, Vec<String>)> = Vec::new();
+    // Built-in + conftest fixtures visible from each directory, shared by sibling files
+    let mut conftest_views: HashMap<PathBuf, IndexMap<String, Fixture>> = HashMap::new();
     for dir in &conftest_dirs {
         let conftest_path = dir.join("conftest.py");
         if conftest_path.is_file() && !conftest_fixtures.contains_key(dir) {
@@ -412,6 +414,7 @@ pub fn discover_tests(
                     config,
                     &module_ids,
                     &conftest_fixtures,
+                    &mut conftest_views,
                     &mut detected_pytest_fixtures,
                 ) {
                     Ok(Some(module)) => {
@@ -436,7 +439,13 @@ pub fn discover_tests(
                 }
             }
             FileType::Markdown => {
-                match collect_from_markdown(py, &file, config, &conftest_fixtures) {
+                match collect_from_markdown(
+                    py,
+                    &file,
+                    config,
+                    &conftest_fixtures,
+                    &mut conftest_views,
+                ) {
                     Ok(Some(module)) => {
                         let tests_in_file = module.tests.len();
                         modules.push(module);
@@ -767,11 +776,41 @@ fn load_conftest_fixtures(
 /// Merge conftest fixtures for a test file with the file's own fixtures.
 /// Conftest fixtures from parent directories are merged from farthest to nearest,
 /// and the test file's own fixtures override any conftest fixtures with the same name.
+///
+/// The merged conftest view only depends on the file's directory, so it is built
+/// once per directory and cached in `conftest_views` for sibling test files.
 fn merge_conftest_fixtures(
     py: Python<'_>,
     test_path: &Path,
     module_fixtures: IndexMap<String, Fixture>,
     conftest_map: &HashMap<PathBuf, IndexMap<String, Fixture>>,
+    conftest_views: &mut HashMap<PathBuf, IndexMap<String, Fixture>>,
+) -> PyResult<IndexMap<String, Fixture>> {
+    let dir = test_path.parent().unwrap_or(test_path);
+    if !conftest_views.contains_key(dir) {
+        let view = build_conftest_view(py, dir, conftest_map)?;
+        conftest_views.insert(dir.to_path_buf(), view);
+    }
+
+    let mut merged: IndexMap<String, Fixture> = conftest_views[dir]
+        .iter()
+        .map(|(name, fixture)| (name.clone(), fixture.clone_with_py(py)))
+        .collect();
+
+    // Module's own fixtures override conftest fixtures
+    for (name, fixture) in module_fixtures {
+        merged.insert(name, fixture);
+    }
+
+    Ok(merged)
+}
+
+/// Build the fixtures visible to every test file in `dir`: the built-in fixtures
+/// followed by conftest fixtures from the farthest ancestor down to `dir` itself.
+fn build_conftest_view(
+    py: Python<'_>,
+    dir: &Path,
+    conftest_map: &HashMap<PathBuf, IndexMap<String, Fixture>>,
 ) -> PyResult<IndexMap<String, Fixture>> {
     let mut merged = IndexMap::new();
 
@@ -781,33 +820,18 @@ fn merge_conftest_fixtures(
     }
 
     // Collect all parent directories from farthest to nearest
-    let mut parent_dirs = Vec::new();
-    if let Some(mut parent) = test_path.parent() {
-        loop {
-            parent_dirs.push(parent.to_path_buf());
-            if let Some(next_parent) = parent.parent() {
-                parent = next_parent;
-            } else {
-                break;
-            }
-        }
-    }
+    let mut parent_dirs: Vec<&Path> = dir.ancestors().collect();
     parent_dirs.reverse(); // Process from farthest to nearest
 
     // Merge conftest fixtures from farthest to nearest
     for dir in parent_dirs {
-        if let Some(fixtures) = conftest_map.get(&dir) {
+        if let Some(fixtures) = conftest_map.get(dir) {
             for (name, fixture) in fixtures {
                 merged.insert(name.clone(), fixture.clone_with_py(py));
             }
         }
     }
 
-    // Module's own fixtures override conftest fixtures
-    for (name, fixture) in module_fixtures {
-        merged.insert(name, fixture);
-    }
-
     Ok(merged)
 }
 
@@ -869,6 +893,7 @@ fn collect_from_file(
     config: &RunConfiguration,
     module_ids: &ModuleIdGenerator,
     conftest_map: &HashMap<PathBuf, IndexMap<String, Fixture>>,
+    conftest_views: &mut HashMap<PathBuf, IndexMap<String, Fixture>>,
     detected_pytest_fixtures: &mut Vec<(PathBuf, Vec<String>)>,
 ) -> PyResult<Option<TestModule>> {
     let (module_name, package_name) = infer_module_names(path, module_ids.next());
@@ -895,7 +920,8 @@ fn collect_from_file(
     }
 
     // Merge conftest fixtures with the module's own fixtures
-    let fixtures = merge_conftest_fixtures(py, path, module_fixtures, conftest_map)?;
+    let fixtures =
+        merge_conftest_fixtures(py, path, module_fixtures, conftest_map, conftest_views)?;
 
     // Expand tests for parametrized fixtures
     let mut tests = expand_tests_for_parametrized_fixtures(py, tests, &fixtures)?;
@@ -929,6 +955,7 @@ fn collect_from_markdown(
     path: &Path,
     config: &RunConfiguration,
     conftest_map: &HashMap<PathBuf, IndexMap<String, Fixture>>,
+    conftest_views: &mut HashMap<PathBuf, IndexMap<String, Fixture>>,
 ) -> PyResult<Option<TestModule>> {
     // Read the markdown file
     let content = std::fs::read_to_string(path).map_err(|e| {
@@ -1000,7 +1027,8 @@ fn collect_from_markdown(
     }
 
     // Merge conftest fixtures for the markdown file
-    let fixtures = merge_conftest_fixtures(py, path, IndexMap::new(), conftest_map)?;
+    let fixtures =
+        merge_conftest_fixtures(py, path, IndexMap::new(), conftest_map, conftest_views)?;
 
     Ok(Some(TestModule::new(path.to_path_buf(), fixtures, tests)))
 }
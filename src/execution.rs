@@ -253,6 +253,9 @@ struct FixtureContext {
     package_cache: IndexMap<String, Py<PyAny>>,
     module_cache: IndexMap<String, Py<PyAny>>,
     class_cache: IndexMap<String, Py<PyAny>>,
+    /// Errors raised while setting up module-or-wider fixtures, keyed like the
+    /// value caches. Re-raised for later dependents instead of re-running setup.
+    setup_errors: IndexMap<String, (FixtureScope, PyErr)>,
     teardowns: TeardownCollector,
     /// Track the current package to detect package transitions
     current_package: Option<String>,
@@ -270,6 +273,7 @@ impl FixtureContext {
             package_cache: IndexMap::new(),
             module_cache: IndexMap::new(),
             class_cache: IndexMap::new(),
+            setup_errors: IndexMap::new(),
             teardowns: TeardownCollector::new(),
             current_package: None,
             session_event_loop: None,
@@ -320,6 +324,13 @@ impl FixtureContext {
         finalize_generators(py, teardowns, event_loop.as_ref());
         cache.clear();
         close_event_loop(py, event_loop);
+        self.clear_setup_errors(scope);
+    }
+
+    /// Forget cached setup errors for fixtures of the given scope.
+    fn clear_setup_errors(&mut self, scope: FixtureScope) {
+        self.setup_errors
+            .retain(|_, (error_scope, _)| *error_scope != scope);
     }
 
     /// Clean up all scopes from narrowest to widest.
@@ -400,6 +411,7 @@ pub fn run_collected_tests(
 
         // Reset module-scoped caches for this module
         context.module_cache.clear();
+        context.clear_setup_errors(FixtureScope::Module);
         close_event_loop(py, &mut context.module_event_loop);
 
         // Group tests by class for class-scoped fixtures
@@ -859,6 +871,7 @@ fn run_async_batch<'a>(
             &mut context.package_cache,
             &mut context.module_cache,
             &mut context.class_cache,
+            &mut context.setup_errors,
             &mut context.teardowns,
             &test.fixture_param_indices,
             &test.indirect_params,
@@ -1521,6 +1534,7 @@ fn execute_test_case(
         &mut context.package_cache,
         &mut context.module_cache,
         &mut context.class_cache,
+        &mut context.setup_errors,
         &mut context.teardowns,
         &test_case.fixture_param_indices,
         &test_case.indirect_params,
@@ -1702,6 +1716,7 @@ struct FixtureResolver<'py> {
     module_cache: &'py mut IndexMap<String, Py<PyAny>>,
     class_cache: &'py mut IndexMap<String, Py<PyAny>>,
     function_cache: IndexMap<String, Py<PyAny>>,
+    setup_errors: &'py mut IndexMap<String, (FixtureScope, PyErr)>,
     teardowns: &'py mut TeardownCollector,
     function_teardowns: Vec<Py<PyAny>>,
     stack: HashSet<String>,
@@ -1745,6 +1760,7 @@ impl<'py> FixtureResolver<'py> {
         package_cache: &'py mut IndexMap<String, Py<PyAny>>,
         module_cache: &'py mut IndexMap<String, Py<PyAny>>,
         class_cache: &'py mut IndexMap<String, Py<PyAny>>,
+        setup_errors: &'py mut IndexMap<String, (FixtureScope, PyErr)>,
         teardowns: &'py mut TeardownCollector,
         fixture_param_indices: &'py IndexMap<String, usize>,
         indirect_params: &'py [String],
@@ -1767,6 +1783,7 @@ impl<'py> FixtureResolver<'py> {
             module_cache,
             class_cache,
             function_cache: IndexMap::new(),
+            setup_errors,
             teardowns,
             function_teardowns: Vec::new(),
             stack: HashSet::new(),
@@ -1793,7 +1810,7 @@ impl<'py> FixtureResolver<'py> {
         // First check if it's a parametrized value
         if let Some(value) = self.parameters.get(name) {
             // If this parameter is indirect, pass the value to the fixture via request.param
-            if self.indirect_params.contains(&name.to_string()) {
+            if self.indirect_params.iter().any(|param| param == name) {
                 let indirect_value = value.clone_ref(self.py);
                 self.indirect_param_override = Some(indirect_value);
                 let result = self.resolve_fixture_value(name);
@@ -1813,52 +1830,6 @@ impl<'py> FixtureResolver<'py> {
             return self.create_request_fixture();
         }
 
-        // Check if this is a parametrized fixture and get the cache key
-        let (cache_key, param_value) = if let Some(&param_idx) =
-            self.fixture_param_indices.get(name)
-        {
-            if let Some(fixture) = self.fixtures.get(name) {
-                if let Some(params) = &fixture.params {
-                    // Bounds check to prevent panic on invalid param_idx
-                    if param_idx >= params.len() {
-                        return Err(invalid_test_definition(format!(
-                                "Invalid parameter index {} for fixture '{}' which only has {} parameters. \
-                                 This may indicate a mismatch between test parametrization and fixture definition.",
-                                param_idx, name, params.len()
-                            )));
-                    }
-                    let param = &params[param_idx];
-                    // Use a cache key that includes the parameter index for parametrized fixtures
-                    let key = format!("{}[{}]", name, param_idx);
-                    (key, Some(param.value.clone_ref(self.py)))
-                } else {
-                    (name.to_string(), None)
-                }
-            } else {
-                (name.to_string(), None)
-            }
-        } else {
-            (name.to_string(), None)
-        };
-
-        // Check all caches in order: function -> class -> module -> package -> session
-        if let Some(value) = self.function_cache.get(&cache_key) {
-            return Ok(value.clone_ref(self.py));
-        }
-        if let Some(value) = self.class_cache.get(&cache_key) {
-            return Ok(value.clone_ref(self.py));
-        }
-        if let Some(value) = self.module_cache.get(&cache_key) {
-            return Ok(value.clone_ref(self.py));
-        }
-        if let Some(value) = self.package_cache.get(&cache_key) {
-            return Ok(value.clone_ref(self.py));
-        }
-        if let Some(value) = self.session_cache.get(&cache_key) {
-            return Ok(value.clone_ref(self.py));
-        }
-
-        // Fixture not in any cache, need to execute it
         let fixture = self.fixtures.get(name).ok_or_else(|| {
             let mut available: Vec<&str> = self.fixtures.keys().map(String::as_str).collect();
             available.sort();
@@ -1874,6 +1845,45 @@ impl<'py> FixtureResolver<'py> {
             ))
         })?;
 
+        // Check if this is a parametrized fixture and get the cache key.
+        // Plain fixtures are looked up by `name` directly; an owned key is only
+        // allocated for parametrized fixtures or when a value is inserted.
+        let (param_key, param_value) = match (self.fixture_param_indices.get(name), &fixture.params)
+        {
+            (Some(&param_idx), Some(params)) => {
+                // Bounds check to prevent panic on invalid param_idx
+                if param_idx >= params.len() {
+                    return Err(invalid_test_definition(format!(
+                            "Invalid parameter index {} for fixture '{}' which only has {} parameters. \
+                             This may indicate a mismatch between test parametrization and fixture definition.",
+                            param_idx, name, params.len()
+                        )));
+                }
+                let param = &params[param_idx];
+                // Use a cache key that includes the parameter index for parametrized fixtures
+                let key = format!("{}[{}]", name, param_idx);
+                (Some(key), Some(param.value.clone_ref(self.py)))
+            }
+            _ => (None, None),
+        };
+        let cache_key = param_key.as_deref().unwrap_or(name);
+
+        // Values are only ever stored in the cache matching the fixture's own
+        // scope, so a single lookup is enough. This also keeps a stale value from
+        // a same-named fixture of another scope (e.g. a module-level override of
+        // a session conftest fixture) from being returned.
+        if let Some(value) = self.scope_cache(fixture.scope).get(cache_key) {
+            return Ok(value.clone_ref(self.py));
+        }
+
+        // A module-or-wider fixture that already failed is not run again for
+        // each dependent test; the original error is raised instead.
+        if let Some((scope, err)) = self.setup_errors.get(cache_key) {
+            if *scope == fixture.scope {
+                return Err(err.clone_ref(self.py));
+            }
+        }
+
         // Set current fixture param for request.param access
         let previous_param = self.current_fixture_param.take();
         // Indirect parametrize override takes precedence over fixture's own params
@@ -1912,7 +1922,45 @@ impl<'py> FixtureResolver<'py> {
 
         // Execute the fixture
         let args_tuple = PyTuple::new(self.py, &args)?;
-        let result = if fixture.is_async_generator {
+        let result = match self.call_fixture(fixture, args_tuple) {
+            Ok(value) => value,
+            Err(err) => {
+                self.stack.remove(&fixture.name);
+                self.current_fixture_param = previous_param;
+                if fixture.scope >= FixtureScope::Module {
+                    self.setup_errors.insert(
+                        cache_key.to_string(),
+                        (fixture.scope, err.clone_ref(self.py)),
+                    );
+                }
+                return Err(err);
+            }
+        };
+
+        self.stack.remove(&fixture.name);
+
+        // Restore previous fixture param
+        self.current_fixture_param = previous_param;
+
+        // Store in the appropriate cache based on scope
+        // Use cache_key which includes param index for parametrized fixtures
+        let cache_key = param_key.unwrap_or_else(|| name.to_string());
+        self.scope_cache_mut(fixture.scope)
+            .insert(cache_key, result.clone_ref(self.py));
+
+        Ok(result)
+    }
+
+    /// Invoke a fixture function and return the value it provides.
+    ///
+    /// Generator fixtures are advanced to their first yield and registered for
+    /// teardown; async fixtures run on the event loop for their scope.
+    fn call_fixture(
+        &mut self,
+        fixture: &Fixture,
+        args_tuple: Bound<'py, PyTuple>,
+    ) -> PyResult<Py<PyAny>> {
+        if fixture.is_async_generator {
             // For async generator fixtures: call to get async generator, then call anext() to get yielded value
             let async_generator = fixture
                 .callable
@@ -1955,7 +2003,7 @@ impl<'py> FixtureResolver<'py> {
                 }
             }
 
-            yielded_value
+            Ok(yielded_value)
         } else if fixture.is_generator {
             // For generator fixtures: call to get generator, then call next() to get yielded value
             let generator = fixture
@@ -1986,7 +2034,7 @@ impl<'py> FixtureResolver<'py> {
                 }
             }
 
-            yielded_value
+            Ok(yielded_value)
         } else if fixture.is_async {
             // For async fixtures: call to get coroutine, then await it using the scoped event loop
             let coro = fixture
@@ -2004,48 +2052,38 @@ impl<'py> FixtureResolver<'py> {
             // Run the coroutine in the scoped event loop
             event_loop
                 .bind(self.py)
-                .call_method1("run_until_complete", (&coro.bind(self.py),))?
-                .unbind()
+                .call_method1("run_until_complete", (&coro.bind(self.py),))
+                .map(|value| value.unbind())
         } else {
             // For regular fixtures: call and use the return value directly
             fixture
                 .callable
                 .bind(self.py)
                 .call1(args_tuple)
-                .map(|value| value.unbind())?
-        };
-
-        self.stack.remove(&fixture.name);
-
-        // Restore previous fixture param
-        self.current_fixture_param = previous_param;
+                .map(|value| value.unbind())
+        }
+    }
 
-        // Store in the appropriate cache based on scope
-        // Use cache_key which includes param index for parametrized fixtures
-        match fixture.scope {
-            FixtureScope::Session => {
-                self.session_cache
-                    .insert(cache_key, result.clone_ref(self.py));
-            }
-            FixtureScope::Package => {
-                self.package_cache
-                    .insert(cache_key, result.clone_ref(self.py));
-            }
-            FixtureScope::Module => {
-                self.module_cache
-                    .insert(cache_key, result.clone_ref(self.py));
-            }
-            FixtureScope::Class => {
-                self.class_cache
-                    .insert(cache_key, result.clone_ref(self.py));
-            }
-            FixtureScope::Function => {
-                self.function_cache
-                    .insert(cache_key, result.clone_ref(self.py));
-            }
+    /// Cache holding resolved values for fixtures of the given scope.
+    fn scope_cache(&self, scope: FixtureScope) -> &IndexMap<String, Py<PyAny>> {
+        match scope {
+            FixtureScope::Session => &*self.session_cache,
+            FixtureScope::Package => &*self.package_cache,
+            FixtureScope::Module => &*self.module_cache,
+            FixtureScope::Class => &*self.class_cache,
+            FixtureScope::Function => &self.function_cache,
         }
+    }
 
-        Ok(result)
+    /// Mutable access to the cache for the given scope.
+    fn scope_cache_mut(&mut self, scope: FixtureScope) -> &mut IndexMap<String, Py<PyAny>> {
+        match scope {
+            FixtureScope::Session => &mut *self.session_cache,
+            FixtureScope::Package => &mut *self.package_cache,
+            FixtureScope::Module => &mut *self.module_cache,
+            FixtureScope::Class => &mut *self.class_cache,
+            FixtureScope::Function => &mut self.function_cache,
+        }
     }
 
     fn resolve_for_request(&mut self, name: &str) -> PyResult<Py<PyAny>> {
@@ -2135,14 +2173,9 @@ impl<'py> FixtureResolver<'py> {
         }
 
         // Resolve each autouse fixture in scope order
-        for (name, _) in autouse_fixtures {
+        for (name, scope) in autouse_fixtures {
             // Skip if already in cache (for higher-scoped autouse fixtures)
-            if self.function_cache.contains_key(&name)
-                || self.class_cache.contains_key(&name)
-                || self.module_cache.contains_key(&name)
-                || self.package_cache.contains_key(&name)
-                || self.session_cache.contains_key(&name)
-            {
+            if self.scope_cache(scope).contains_key(&name) {
                 continue;
             }
 
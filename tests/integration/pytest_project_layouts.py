@@ -7,47 +7,64 @@ can correctly discover and run tests for each layout pattern.
 NOTE: These tests use pytest fixtures and subprocess to test rustest externally.
 They are automatically skipped when run with rustest (via conftest.py).
 """
+import os
 import subprocess
 import sys
-import tempfile
-from pathlib import Path
 
 import pytest
 
 
-def run_rustest(project_dir):
-    """Run rustest on a project directory and return result."""
-    cmd = [sys.executable, "-m", "rustest", str(project_dir / "tests"), "--color", "never"]
-    result = subprocess.run(cmd, cwd=project_dir, capture_output=True, text=True)
-    return result
+def start_rustest(project_dir, target="tests"):
+    """Start rustest on ``target`` inside a project without waiting for it.
 
+    Only the summary on stderr is inspected, so stdout is discarded rather
+    than buffered and decoded.
+    """
+    cmd = [sys.executable, "-m", "rustest", os.path.join(project_dir, target), "--color", "never"]
+    return subprocess.Popen(
+        cmd,
+        cwd=project_dir,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
 
-@pytest.fixture
-def src_layout_project(tmp_path):
-    """Create a project with src/ layout."""
-    # Create structure
-    src_dir = tmp_path / "src"
-    pkg_dir = src_dir / "mypackage"
-    pkg_dir.mkdir(parents=True)
-    tests_dir = tmp_path / "tests"
-    tests_dir.mkdir()
 
-    # Create package files
-    (pkg_dir / "__init__.py").write_text("""
+def wait_rustest(proc):
+    """Wait for a process from ``start_rustest`` and return its result."""
+    _, stderr = proc.communicate()
+    return subprocess.CompletedProcess(proc.args, proc.returncode, None, stderr)
+
+
+def _materialize(base_dir, files):
+    """Write ``files`` (relative path -> source bytes) under the ``base_dir`` string.
+
+    Only leaf directories are created explicitly; ``os.makedirs`` builds
+    the intermediate package levels on the way down.
+    """
+    parents = {os.path.dirname(relpath) for relpath in files}
+    for parent in sorted(parents):
+        if not any(other.startswith(parent + "/") for other in parents):
+            os.makedirs(os.path.join(base_dir, parent), exist_ok=True)
+    for relpath, content in files.items():
+        with open(os.path.join(base_dir, relpath), "wb") as f:
+            f.write(content)
+    return base_dir
+
+
+SRC_LAYOUT_FILES = {
+    "src/mypackage/__init__.py": b"""
 def greet(name):
     return f"Hello, {name}!"
 
 def add(a, b):
     return a + b
-""")
-
-    (pkg_dir / "utils.py").write_text("""
+""",
+    "src/mypackage/utils.py": b"""
 def multiply(a, b):
     return a * b
-""")
-
-    # Create test files
-    (tests_dir / "test_basic.py").write_text("""
+""",
+    "tests/test_basic.py": b"""
 from mypackage import greet, add
 from mypackage.utils import multiply
 
@@ -59,61 +76,32 @@ def test_add():
 
 def test_multiply():
     assert multiply(4, 5) == 20
-""")
-
-    return tmp_path
-
-
-@pytest.fixture
-def flat_layout_project(tmp_path):
-    """Create a project with flat layout."""
-    # Create structure
-    pkg_dir = tmp_path / "mypackage"
-    pkg_dir.mkdir()
-    tests_dir = tmp_path / "tests"
-    tests_dir.mkdir()
+""",
+}
 
-    # Create package files
-    (pkg_dir / "__init__.py").write_text("""
+FLAT_LAYOUT_FILES = {
+    "mypackage/__init__.py": b"""
 def subtract(a, b):
     return a - b
-""")
-
-    # Create test files
-    (tests_dir / "test_flat.py").write_text("""
+""",
+    "tests/test_flat.py": b"""
 from mypackage import subtract
 
 def test_subtract():
     assert subtract(10, 3) == 7
     assert subtract(0, 5) == -5
-""")
-
-    return tmp_path
-
+""",
+}
 
-@pytest.fixture
-def nested_package_project(tmp_path):
-    """Create a project with nested packages."""
-    # Create structure
-    pkg_dir = tmp_path / "mypackage"
-    pkg_dir.mkdir()
-    sub_dir = pkg_dir / "subpackage"
-    sub_dir.mkdir()
-    tests_dir = tmp_path / "tests"
-    tests_dir.mkdir()
-
-    # Create package files
-    (pkg_dir / "__init__.py").write_text("""
+NESTED_PACKAGE_FILES = {
+    "mypackage/__init__.py": b"""
 VERSION = "1.0.0"
-""")
-
-    (sub_dir / "__init__.py").write_text("""
+""",
+    "mypackage/subpackage/__init__.py": b"""
 def process(data):
     return data.upper()
-""")
-
-    # Create test files
-    (tests_dir / "test_nested.py").write_text("""
+""",
+    "tests/test_nested.py": b"""
 from mypackage import VERSION
 from mypackage.subpackage import process
 
@@ -122,30 +110,61 @@ def test_version():
 
 def test_process():
     assert process("hello") == "HELLO"
-""")
-
-    return tmp_path
-
-
-def test_src_layout(src_layout_project):
+""",
+}
+
+
+# name -> (files, rustest target). Single-file projects point rustest straight
+# at the test module; the nested project keeps a directory target so the
+# discovery walk stays covered.
+LAYOUT_PROJECTS = {
+    "src_layout": (SRC_LAYOUT_FILES, "tests/test_basic.py"),
+    "flat_layout": (FLAT_LAYOUT_FILES, "tests/test_flat.py"),
+    "nested_packages": (NESTED_PACKAGE_FILES, "tests"),
+}
+
+
+@pytest.fixture(scope="module")
+def layout_runs(tmp_path_factory):
+    """Build every layout project and start rustest on all of them at once.
+
+    The runs are independent and dominated by interpreter startup, so
+    launching them together overlaps that cost; each test then waits only
+    for its own process.
+    """
+    procs = {
+        name: start_rustest(_materialize(str(tmp_path_factory.mktemp(name)), files), target)
+        for name, (files, target) in LAYOUT_PROJECTS.items()
+    }
+    yield procs
+    # Reap every run, including ones whose test was deselected or failed
+    # before waiting, so no stderr pipe is left open.
+    for proc in procs.values():
+        if proc.poll() is None:
+            proc.kill()
+        if not proc.stderr.closed:
+            proc.communicate()
+
+
+def test_src_layout(layout_runs):
     """Test that src/ layout works without PYTHONPATH."""
-    result = run_rustest(src_layout_project)
+    result = wait_rustest(layout_runs["src_layout"])
 
     assert result.returncode == 0, f"rustest failed: {result.stderr}"
     assert "3 passed" in result.stderr, f"Expected 3 tests to pass: {result.stderr}"
 
 
-def test_flat_layout(flat_layout_project):
+def test_flat_layout(layout_runs):
     """Test that flat layout works without PYTHONPATH."""
-    result = run_rustest(flat_layout_project)
+    result = wait_rustest(layout_runs["flat_layout"])
 
     assert result.returncode == 0, f"rustest failed: {result.stderr}"
     assert "1 passed" in result.stderr, f"Expected 1 test to pass: {result.stderr}"
 
 
-def test_nested_packages(nested_package_project):
+def test_nested_packages(layout_runs):
     """Test that nested package structures work correctly."""
-    result = run_rustest(nested_package_project)
+    result = wait_rustest(layout_runs["nested_packages"])
 
     assert result.returncode == 0, f"rustest failed: {result.stderr}"
     assert "2 passed" in result.stderr, f"Expected 2 tests to pass: {result.stderr}"
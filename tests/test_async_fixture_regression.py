@@ -15,7 +15,7 @@ if "pytest" in sys.argv[0]:
     import pytest
     pytest.skip("This test file requires rustest runner (rustest-only tests)", allow_module_level=True)
 
-from rustest import fixture, mark
+from rustest import fixture, mark, parametrize
 
 
 # ============================================================================
@@ -136,21 +136,10 @@ class TestSessionFixtureInClassB:
 # ============================================================================
 
 
-# Generate multiple tests to stress-test the event loop management
-def generate_session_stress_tests():
-    """Generate many tests to ensure session event loop doesn't close prematurely."""
-
-    for i in range(20):
-        # Dynamically create test functions
-        test_name = f"test_session_stress_{i}"
-
-        async def test_func(session_async_resource):
-            assert session_async_resource["created"] is True
-            assert session_async_resource["call_count"] == 1
-
-        test_func.__name__ = test_name
-        globals()[test_name] = test_func
-
-
-# Generate the stress tests
-generate_session_stress_tests()
+# One parametrized test body exercised 20 times to ensure the session
+# event loop doesn't close prematurely.
+@parametrize("i", list(range(20)))
+async def test_session_stress(i, session_async_resource):
+    """Stress the session event loop with repeated fixture use."""
+    assert session_async_resource["created"] is True
+    assert session_async_resource["call_count"] == 1
@@ -21,7 +21,7 @@ from rustest.compat import pytest as rustest_pytest
 @mark.asyncio
 async def test_basic_async():
     """Test basic async function execution."""
-    await asyncio.sleep(0.001)
+    await asyncio.sleep(0)
     assert True
 
 
@@ -215,19 +215,19 @@ async def test_async_skipif():
 # Helper async functions for tests
 async def async_add(x, y):
     """Helper async function that adds two numbers."""
-    await asyncio.sleep(0.001)  # Simulate async operation
+    await asyncio.sleep(0)  # Simulate async operation
     return x + y
 
 
 async def async_multiply(x, y):
     """Helper async function that multiplies two numbers."""
-    await asyncio.sleep(0.001)
+    await asyncio.sleep(0)
     return x * y
 
 
 async def async_divide(x, y):
     """Helper async function that divides two numbers."""
-    await asyncio.sleep(0.001)
+    await asyncio.sleep(0)
     if y < 0:
         raise ValueError("negative divisor not allowed")
     return x / y
@@ -237,7 +237,7 @@ async def async_fibonacci(n):
     """Helper async function that calculates fibonacci number."""
     if n <= 1:
         return n
-    await asyncio.sleep(0.0001)
+    await asyncio.sleep(0)
     a, b = 0, 1
     for _ in range(n):
         a, b = b, a + b
@@ -248,18 +248,18 @@ class AsyncContextManager:
     """Async context manager for testing."""
 
     async def __aenter__(self):
-        await asyncio.sleep(0.001)
+        await asyncio.sleep(0)
         return "context_value"
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        await asyncio.sleep(0.001)
+        await asyncio.sleep(0)
         return None
 
 
 async def async_range(n):
     """Async generator for testing."""
     for i in range(n):
-        await asyncio.sleep(0.001)
+        await asyncio.sleep(0)
         yield i
 
 
@@ -4,11 +4,8 @@ import os
 
 import rustest as testlib
 
-AUTOUSE_ENV_VAR = "RUSTEST_PARENT_AUTOUSE_LAST_TEST"
-ASYNC_AUTOUSE_ENV_VAR = "RUSTEST_PARENT_ASYNC_AUTOUSE_LAST_TEST"
-# Ensure we start from a clean state each time the module is imported
-os.environ.pop(AUTOUSE_ENV_VAR, None)
-os.environ.pop(ASYNC_AUTOUSE_ENV_VAR, None)
+# Name of the last test seen by each root autouse marker fixture
+_autouse_last_test = {"sync": None, "async": None}
 
 
 @testlib.fixture
@@ -38,7 +35,13 @@ def nested_session_fixture():
 @testlib.fixture(autouse=True)
 def root_autouse_marker(request):
     """Autouse fixture used to verify parent conftest loading in nested dirs."""
-    os.environ[AUTOUSE_ENV_VAR] = request.node.name
+    _autouse_last_test["sync"] = request.node.name
+
+
+@testlib.fixture
+def autouse_last_test():
+    """Expose what the root autouse markers recorded to nested test modules."""
+    return _autouse_last_test
 
 
 if os.environ.get("RUSTEST_RUNNING") == "1":
@@ -47,4 +50,4 @@ if os.environ.get("RUSTEST_RUNNING") == "1":
     async def root_async_autouse_marker(request):
         """Async autouse fixture to ensure async variants propagate across dirs."""
         await asyncio.sleep(0)
-        os.environ[ASYNC_AUTOUSE_ENV_VAR] = request.node.name
+        _autouse_last_test["async"] = request.node.name
@@ -4,9 +4,6 @@ import os
 
 import pytest
 
-AUTOUSE_ENV_VAR = "RUSTEST_PARENT_AUTOUSE_LAST_TEST"
-ASYNC_AUTOUSE_ENV_VAR = "RUSTEST_PARENT_ASYNC_AUTOUSE_LAST_TEST"
-
 requires_rustest = pytest.mark.skipif(
     os.environ.get("RUSTEST_RUNNING") != "1",
     reason="async autouse fixtures supported only when running under rustest",
@@ -53,16 +50,16 @@ def test_root_only_in_deep(root_only):
     assert root_only == "root_only_value"
 
 
-def test_root_autouse_runs_for_deep_dir():
+def test_root_autouse_runs_for_deep_dir(autouse_last_test):
     """Root-level autouse fixture should run even in deeper directories."""
     assert (
-        os.environ.get(AUTOUSE_ENV_VAR) == "test_root_autouse_runs_for_deep_dir"
+        autouse_last_test["sync"] == "test_root_autouse_runs_for_deep_dir"
     ), "Parent autouse fixture did not run for deep directory tests"
 
 
 @requires_rustest
-def test_root_async_autouse_runs_for_deep_dir():
+def test_root_async_autouse_runs_for_deep_dir(autouse_last_test):
     """Root-level async autouse fixture should run even in deeper directories."""
     assert (
-        os.environ.get(ASYNC_AUTOUSE_ENV_VAR) == "test_root_async_autouse_runs_for_deep_dir"
+        autouse_last_test["async"] == "test_root_async_autouse_runs_for_deep_dir"
     ), "Parent async autouse fixture did not run for deep directory tests"
@@ -18,3 +18,9 @@ def conftest_only():
 def another_shared():
     """Another fixture that will be overridden."""
     return "conftest_version"
+
+
+@testlib.fixture(scope="session")
+def scoped_shared():
+    """Session fixture overridden by a module-scoped fixture in one module."""
+    return "conftest_session"
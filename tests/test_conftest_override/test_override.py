@@ -46,3 +46,8 @@ def test_combined(shared_name, conftest_only, another_shared, module_only):
     assert conftest_only == "conftest_value"
     assert another_shared == "module_version"
     assert module_only == "module_value"
+
+
+def test_uses_conftest_session_fixture(scoped_shared):
+    """Modules without an override get the conftest session fixture."""
+    assert scoped_shared == "conftest_session"
@@ -0,0 +1,22 @@
+"""Test that a module-scoped fixture overrides a same-named session fixture.
+
+``test_override.py`` caches the conftest's session ``scoped_shared``; this
+module must still resolve its own module-scoped fixture, not that value.
+"""
+import rustest
+
+
+@rustest.fixture(scope="module")
+def scoped_shared():
+    """Module-scoped override of the conftest session fixture."""
+    return "module_override"
+
+
+def test_uses_module_scoped_override(scoped_shared):
+    """Module override takes precedence over the cached session value."""
+    assert scoped_shared == "module_override"
+
+
+def test_override_is_stable_within_module(scoped_shared):
+    """The module-scoped override is reused for later tests in the module."""
+    assert scoped_shared == "module_override"
@@ -5,24 +5,22 @@ but should be different instances for different classes.
 """
 
 import unittest
+from collections import Counter
 
 from rustest import fixture
 
 # Track fixture calls
-class_fixture_calls = {}
+class_fixture_calls = Counter()
 
 
 def reset_class_calls():
     """Reset call tracking."""
     global class_fixture_calls
-    class_fixture_calls = {}
+    class_fixture_calls = Counter()
 
 
 def track_call(name):
     """Track and return call count."""
-    global class_fixture_calls
-    if name not in class_fixture_calls:
-        class_fixture_calls[name] = 0
     class_fixture_calls[name] += 1
     return class_fixture_calls[name]
 
@@ -93,10 +93,10 @@ def test_getfixturevalue_async_generator(request):
 
 
 # Parametrized tests using getfixturevalue
-MODEL_FIXTURES = [
+MODEL_FIXTURES = (
     ("simple_fixture", "hello"),
     ("another_fixture", 42),
-]
+)
 
 
 @pytest.mark.parametrize("fixture_name,expected", MODEL_FIXTURES)
@@ -126,11 +126,11 @@ def model_c():
     return {"type": "C", "value": 3}
 
 
-MODEL_CONFIGS = [
+MODEL_CONFIGS = (
     ("model_a", "A", 1),
     ("model_b", "B", 2),
     ("model_c", "C", 3),
-]
+)
 
 
 @pytest.mark.parametrize("fixture_name,expected_type,expected_value", MODEL_CONFIGS)
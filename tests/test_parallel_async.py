@@ -13,7 +13,9 @@ Key test areas:
 6. Performance validation
 """
 
+from array import array
 import asyncio
+import itertools
 import sys
 import time
 
@@ -31,18 +33,22 @@ from rustest.decorators import skip_decorator
 # Module-level shared state for testing parallel execution
 # ============================================================================
 
-# Track execution order to verify parallelism
-execution_log: list[tuple[str, float]] = []
+# Track execution order to verify parallelism. Names and timestamps are kept
+# in parallel sequences so logging does not allocate a tuple per entry.
+execution_log_names: list[str] = []
+execution_log_times = array("q")
 
 
 def log_execution(name: str) -> None:
-    """Log test execution with timestamp."""
-    execution_log.append((name, time.time()))
+    """Log test execution with a monotonic nanosecond timestamp."""
+    execution_log_names.append(name)
+    execution_log_times.append(time.perf_counter_ns())
 
 
 def reset_log() -> None:
     """Reset the execution log."""
-    execution_log.clear()
+    execution_log_names.clear()
+    del execution_log_times[:]
 
 
 # ============================================================================
@@ -52,7 +58,7 @@ def reset_log() -> None:
 @fixture(scope="module")
 async def module_resource():
     """Module-scoped async fixture shared by parallel tests."""
-    await asyncio.sleep(0.01)
+    await asyncio.sleep(0)
     return {"initialized": True, "counter": 0}
 
 
@@ -89,7 +95,7 @@ async def test_parallel_module_scope_3(module_resource):
 @fixture(scope="class")
 async def class_resource():
     """Class-scoped async fixture for TestParallelClass."""
-    await asyncio.sleep(0.01)
+    await asyncio.sleep(0)
     return {"class_data": "shared"}
 
 
@@ -126,7 +132,7 @@ class TestParallelClass:
 @fixture(scope="session")
 async def parallel_session_resource():
     """Session-scoped async fixture for parallel tests."""
-    await asyncio.sleep(0.01)
+    await asyncio.sleep(0)
     return {"session_id": "test_session"}
 
 
@@ -162,7 +168,7 @@ def test_sync_between_async_1():
 async def test_async_after_sync():
     """Async test after sync test."""
     log_execution("async_after_sync")
-    await asyncio.sleep(0.01)
+    await asyncio.sleep(0)
     assert True
 
 
@@ -176,10 +182,13 @@ def test_sync_between_async_2():
 # Test: Fixture scopes in parallel context
 # ============================================================================
 
+_function_fixture_ids = itertools.count()
+
+
 @fixture(scope="function")
 async def function_fixture():
     """Function-scoped fixture (should be unique per test)."""
-    return {"id": id(asyncio.current_task())}
+    return {"id": next(_function_fixture_ids)}
 
 
 @fixture(scope="module")
@@ -195,7 +204,7 @@ async def test_fixture_scopes_parallel_1(function_fixture, module_fixture_for_pa
     # Module fixture should be shared across this batch
     assert function_fixture is not None
     assert module_fixture_for_parallel is not None
-    await asyncio.sleep(0.01)
+    await asyncio.sleep(0)
 
 
 @mark.asyncio(loop_scope="module")
@@ -203,7 +212,7 @@ async def test_fixture_scopes_parallel_2(function_fixture, module_fixture_for_pa
     """Test fixture scopes in parallel - test 2."""
     assert function_fixture is not None
     assert module_fixture_for_parallel is not None
-    await asyncio.sleep(0.01)
+    await asyncio.sleep(0)
 
 
 # ============================================================================
@@ -224,14 +233,14 @@ async def async_generator_resource():
 async def test_async_generator_parallel_1(async_generator_resource):
     """Test async generator fixture in parallel - test 1."""
     assert async_generator_resource["setup_done"]
-    await asyncio.sleep(0.01)
+    await asyncio.sleep(0)
 
 
 @mark.asyncio(loop_scope="module")
 async def test_async_generator_parallel_2(async_generator_resource):
     """Test async generator fixture in parallel - test 2."""
     assert async_generator_resource["setup_done"]
-    await asyncio.sleep(0.01)
+    await asyncio.sleep(0)
 
 
 # ============================================================================
@@ -240,7 +249,7 @@ async def test_async_generator_parallel_2(async_generator_resource):
 
 async def _simple_pass_test() -> None:
     """Shared helper: minimal async test body that simply passes."""
-    await asyncio.sleep(0.01)
+    await asyncio.sleep(0)
     assert True
 
 
@@ -263,7 +272,7 @@ async def test_parallel_error_handling_pass_2():
 @mark.asyncio(loop_scope="module")
 async def test_exception_in_parallel_context():
     """Test that exceptions are properly caught and reported."""
-    await asyncio.sleep(0.01)
+    await asyncio.sleep(0)
     with raises(ValueError, match="expected"):
         raise ValueError("expected error")
 
@@ -289,7 +298,7 @@ async def test_parametrized_parallel(value):
 async def test_function_scope_1():
     """Function-scoped tests run sequentially (each gets own loop)."""
     log_execution("function_scope_1")
-    await asyncio.sleep(0.01)
+    await asyncio.sleep(0)
     assert True
 
 
@@ -297,7 +306,7 @@ async def test_function_scope_1():
 async def test_function_scope_2():
     """Function-scoped tests run sequentially (each gets own loop)."""
     log_execution("function_scope_2")
-    await asyncio.sleep(0.01)
+    await asyncio.sleep(0)
     assert True
 
 
@@ -307,7 +316,7 @@ async def test_function_scope_2():
 
 async def async_helper(value: int) -> int:
     """Helper async function for gather tests."""
-    await asyncio.sleep(0.01)
+    await asyncio.sleep(0)
     return value * 2
 
 
@@ -340,14 +349,13 @@ async def test_gather_inside_parallel_2():
 async def test_create_task_in_parallel():
     """Test creating tasks inside parallel test execution."""
     async def background_task(n: int) -> int:
-        await asyncio.sleep(0.01)
+        await asyncio.sleep(0)
         return n
 
     task1 = asyncio.create_task(background_task(5))
     task2 = asyncio.create_task(background_task(10))
 
-    result1 = await task1
-    result2 = await task2
+    result1, result2 = await asyncio.gather(task1, task2)
 
     assert result1 == 5
     assert result2 == 10
@@ -390,36 +398,13 @@ NUM_PARALLEL_TESTS = 5
 @fixture(scope="module")
 def performance_start_time():
     """Record start time for performance validation."""
-    return time.time()
-
-
-@mark.asyncio(loop_scope="module")
-async def test_performance_parallel_1():
-    """Performance test 1/5."""
-    await asyncio.sleep(PARALLEL_SLEEP_DURATION)
-
-
-@mark.asyncio(loop_scope="module")
-async def test_performance_parallel_2():
-    """Performance test 2/5."""
-    await asyncio.sleep(PARALLEL_SLEEP_DURATION)
-
-
-@mark.asyncio(loop_scope="module")
-async def test_performance_parallel_3():
-    """Performance test 3/5."""
-    await asyncio.sleep(PARALLEL_SLEEP_DURATION)
-
-
-@mark.asyncio(loop_scope="module")
-async def test_performance_parallel_4():
-    """Performance test 4/5."""
-    await asyncio.sleep(PARALLEL_SLEEP_DURATION)
+    return time.perf_counter()
 
 
 @mark.asyncio(loop_scope="module")
-async def test_performance_parallel_5():
-    """Performance test 5/5."""
+@parametrize("n", list(range(NUM_PARALLEL_TESTS)))
+async def test_performance_parallel(n):
+    """Performance test; the cases share one module-loop batch."""
     await asyncio.sleep(PARALLEL_SLEEP_DURATION)
 
 
@@ -453,14 +438,14 @@ async def test_after_skipped():
 @fixture(scope="module")
 async def base_async_fixture():
     """Base async fixture."""
-    await asyncio.sleep(0.01)
+    await asyncio.sleep(0)
     return "base"
 
 
 @fixture(scope="module")
 async def derived_async_fixture(base_async_fixture):
     """Derived async fixture depending on base."""
-    await asyncio.sleep(0.01)
+    await asyncio.sleep(0)
     return f"{base_async_fixture}_derived"
 
 
@@ -468,14 +453,14 @@ async def derived_async_fixture(base_async_fixture):
 async def test_nested_fixtures_1(derived_async_fixture):
     """Test with nested async fixtures - test 1."""
     assert derived_async_fixture == "base_derived"
-    await asyncio.sleep(0.01)
+    await asyncio.sleep(0)
 
 
 @mark.asyncio(loop_scope="module")
 async def test_nested_fixtures_2(derived_async_fixture):
     """Test with nested async fixtures - test 2."""
     assert derived_async_fixture == "base_derived"
-    await asyncio.sleep(0.01)
+    await asyncio.sleep(0)
 
 
 # ============================================================================
@@ -572,7 +557,7 @@ async def test_exception_isolation_passes_3(reset_exception_tracking):
 @parametrize("n", list(range(20)))
 async def test_large_batch_parametrized(n):
     """Test large parametrized batch (20 concurrent tests)."""
-    await asyncio.sleep(0.01)
+    await asyncio.sleep(0)
     assert n >= 0 and n < 20
 
 
@@ -586,7 +571,7 @@ async def test_event_loop_state_1():
     loop = asyncio.get_running_loop()
     assert loop is not None
     assert not loop.is_closed()
-    await asyncio.sleep(0.01)
+    await asyncio.sleep(0)
 
 
 @mark.asyncio(loop_scope="module")
@@ -596,7 +581,7 @@ async def test_event_loop_state_2():
     assert loop is not None
     assert not loop.is_closed()
     # Verify we can create and await tasks
-    result = await asyncio.create_task(asyncio.sleep(0.01))
+    result = await asyncio.create_task(asyncio.sleep(0))
     assert result is None
 
 
@@ -608,7 +593,7 @@ async def test_event_loop_state_2():
 async def test_rapid_awaits_1():
     """Test with many rapid sequential awaits."""
     for _ in range(10):
-        await asyncio.sleep(0.001)
+        await asyncio.sleep(0)
     assert True
 
 
@@ -616,7 +601,7 @@ async def test_rapid_awaits_1():
 async def test_rapid_awaits_2():
     """Another test with rapid awaits running concurrently."""
     for _ in range(10):
-        await asyncio.sleep(0.001)
+        await asyncio.sleep(0)
     assert True
 
 
@@ -628,7 +613,7 @@ async def test_rapid_awaits_2():
 async def test_nested_task_creation_1():
     """Test creating nested tasks within parallel execution."""
     async def inner_task(value: int) -> int:
-        await asyncio.sleep(0.01)
+        await asyncio.sleep(0)
         return value * 2
 
     # Create multiple nested tasks
@@ -641,7 +626,7 @@ async def test_nested_task_creation_1():
 async def test_nested_task_creation_2():
     """Another test with nested tasks to verify no interference."""
     async def inner_task(value: str) -> str:
-        await asyncio.sleep(0.01)
+        await asyncio.sleep(0)
         return value.upper()
 
     tasks = [asyncio.create_task(inner_task(s)) for s in ["a", "b", "c"]]
@@ -660,12 +645,12 @@ class AsyncResource:
         self.exited = False
 
     async def __aenter__(self):
-        await asyncio.sleep(0.01)
+        await asyncio.sleep(0)
         self.entered = True
         return self
 
     async def __aexit__(self, *args):
-        await asyncio.sleep(0.01)
+        await asyncio.sleep(0)
         self.exited = True
 
 
@@ -674,7 +659,7 @@ async def test_async_context_manager_1():
     """Test async context managers work correctly in parallel."""
     async with AsyncResource() as resource:
         assert resource.entered
-        await asyncio.sleep(0.01)
+        await asyncio.sleep(0)
     assert resource.exited
 
 
@@ -683,7 +668,7 @@ async def test_async_context_manager_2():
     """Another async context manager test running concurrently."""
     async with AsyncResource() as resource:
         assert resource.entered
-        await asyncio.sleep(0.01)
+        await asyncio.sleep(0)
     assert resource.exited
 
 
@@ -873,7 +858,7 @@ def track_fixture_error():
 async def test_before_fixture_error(track_fixture_error):
     """Test that runs before the fixture error test."""
     track_fixture_error["before_ran"] = True
-    await asyncio.sleep(0.01)
+    await asyncio.sleep(0)
     assert True
 
 
@@ -890,7 +875,7 @@ async def test_with_failing_fixture(failing_fixture):
 async def test_after_fixture_error(track_fixture_error):
     """Test that runs after fixture error - should still execute."""
     track_fixture_error["after_ran"] = True
-    await asyncio.sleep(0.01)
+    await asyncio.sleep(0)
     assert True
 
 